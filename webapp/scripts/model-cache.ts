@@ -0,0 +1,73 @@
+/**
+ * Shared on-disk cache of the parsed AISMM model.
+ *
+ * Written by `npm run sync` and the YAML validator, read by the validator
+ * and the agent's model loader. The cache is a single file: the hash of the
+ * YAML bytes it was parsed from on the first line, then the model as JSON.
+ * Readers only accept it when that hash matches the YAML they would
+ * otherwise parse. Only tab-free YAML is ever cached, since the validator
+ * rejects tabs and skips its tab check on a cache hit.
+ */
+
+import { createHash } from 'crypto';
+import { mkdirSync, readFileSync, writeFileSync } from 'fs';
+import { join, dirname } from 'path';
+import { fileURLToPath } from 'url';
+
+// Kept under node_modules (not public/) so it is never shipped with the build
+export const CACHE_DIR = join(dirname(fileURLToPath(import.meta.url)), '..', 'node_modules', '.cache', 'aismm');
+export const MODEL_CACHE = join(CACHE_DIR, 'aismm-model.json');
+
+/**
+ * Hash file contents; used as the cache key.
+ */
+export function hashContent(data: Buffer | string): string {
+  return createHash('blake2b512').update(data).digest('hex');
+}
+
+/**
+ * Read a cache entry, returning null if it is missing or unreadable.
+ */
+export function readCache(path: string): string | null {
+  try {
+    return readFileSync(path, 'utf-8');
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Write a cache entry. Failures are ignored; the cache is only an optimization.
+ */
+export function writeCache(path: string, contents: string): void {
+  try {
+    mkdirSync(CACHE_DIR, { recursive: true });
+    writeFileSync(path, contents);
+  } catch {
+    // Read-only checkout or similar; fall back to uncached runs.
+  }
+}
+
+/**
+ * Read the cached model if it was parsed from YAML with the given hash.
+ */
+export function readModelCache(hash: string): { model: unknown } | null {
+  const cached = readCache(MODEL_CACHE);
+  const eol = cached?.indexOf('\n') ?? -1;
+  if (!cached || eol === -1 || cached.slice(0, eol) !== hash) {
+    return null;
+  }
+  try {
+    return { model: JSON.parse(cached.slice(eol + 1)) };
+  } catch {
+    // Corrupt cache entry; callers reparse and overwrite it.
+    return null;
+  }
+}
+
+/**
+ * Cache a model parsed from tab-free YAML with the given hash.
+ */
+export function writeModelCache(hash: string, model: unknown): void {
+  writeCache(MODEL_CACHE, `${hash}\n${JSON.stringify(model)}`);
+}
@@ -1,12 +1,16 @@
 #!/usr/bin/env npx tsx
 /**
  * Sync AISMM YAML definition to webapp public folder
- * Copies aismm_definition/aismm.yaml to webapp/public/aismm.yaml
+ * Copies aismm_definition/aismm.yaml to webapp/public/aismm.yaml and writes
+ * the parsed model to the shared model cache (see model-cache.ts) so the
+ * Node agent and the validator can skip YAML parsing
  */
 
-import { copyFileSync, existsSync, mkdirSync } from 'fs';
+import { constants, copyFileSync, existsSync, mkdirSync, readFileSync, statSync } from 'fs';
 import { join, dirname } from 'path';
 import { fileURLToPath } from 'url';
+import { load as parseYaml } from 'js-yaml';
+import { MODEL_CACHE, hashContent, readModelCache, writeModelCache } from './model-cache.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
@@ -15,6 +19,19 @@ const ROOT_DIR = join(__dirname, '..', '..');
 const SOURCE_YAML = join(ROOT_DIR, 'aismm_definition', 'aismm.yaml');
 const DEST_DIR = join(__dirname, '..', 'public');
 const DEST_YAML = join(DEST_DIR, 'aismm.yaml');
+const TAB = 0x09;
+
+/**
+ * Check whether a copied file already has exactly the source's bytes.
+ * A size mismatch answers cheaply; otherwise the contents are compared,
+ * since mtimes can't be trusted after checkouts or mtime-preserving copies.
+ */
+function hasSameContents(source: Buffer, dest: string): boolean {
+  if (!existsSync(dest) || statSync(dest).size !== source.length) {
+    return false;
+  }
+  return readFileSync(dest).equals(source);
+}
 
 function syncYaml(): void {
   console.log('Syncing AISMM YAML to webapp...');
@@ -25,6 +42,17 @@ function syncYaml(): void {
     process.exit(1);
   }
   
+  // Skip outputs that are already current, so unchanged builds don't
+  // invalidate downstream webapp caches
+  const source = readFileSync(SOURCE_YAML);
+  const yamlCurrent = hasSameContents(source, DEST_YAML);
+  const hash = hashContent(source);
+  const jsonCurrent = readModelCache(hash) !== null;
+  if (yamlCurrent && jsonCurrent) {
+    console.log(`aismm.yaml is up-to-date at ${DEST_YAML}`);
+    return;
+  }
+  
   // Create destination directory if it doesn't exist
   if (!existsSync(DEST_DIR)) {
     try {
@@ -36,13 +64,33 @@ function syncYaml(): void {
     }
   }
   
-  // Copy the file
-  try {
-    copyFileSync(SOURCE_YAML, DEST_YAML);
-    console.log(`Successfully copied aismm.yaml to ${DEST_YAML}`);
-  } catch (e) {
-    console.error('Error copying file:', e);
-    process.exit(1);
+  // Copy the file. copyFileSync already copies kernel-side (copy_file_range /
+  // sendfile); FICLONE additionally tries a copy-on-write reflink and falls
+  // back to a regular copy when the filesystem doesn't support it.
+  if (!yamlCurrent) {
+    try {
+      copyFileSync(SOURCE_YAML, DEST_YAML, constants.COPYFILE_FICLONE);
+      console.log(`Successfully copied aismm.yaml to ${DEST_YAML}`);
+    } catch (e) {
+      console.error('Error copying file:', e);
+      process.exit(1);
+    }
+  }
+  
+  // Cache the parsed model so the agent and validator can skip YAML parsing.
+  // YAML with tabs is never cached; the validator rejects it.
+  if (!jsonCurrent) {
+    if (source.indexOf(TAB) !== -1) {
+      console.warn('Warning: aismm.yaml contains tab characters; run `npm run validate`. Parsed model not cached.');
+      return;
+    }
+    try {
+      writeModelCache(hash, parseYaml(source.toString('utf-8')));
+      console.log(`Successfully cached parsed model at ${MODEL_CACHE}`);
+    } catch (e) {
+      console.error('Error parsing YAML model:', e);
+      process.exit(1);
+    }
   }
 }
 
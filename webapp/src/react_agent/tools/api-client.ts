@@ -13,7 +13,8 @@ import type {
 import { readFile } from 'fs/promises';
 import { join, dirname } from 'path';
 import { fileURLToPath } from 'url';
-import { parse as parseYaml } from 'yaml';
+import { load as parseYaml } from 'js-yaml';
+import { hashContent, readModelCache } from '../../../scripts/model-cache.js';
 
 /**
  * Fetch all organizations
@@ -88,7 +89,8 @@ let cachedAISMMModel: AISMMModel | null = null;
 
 /**
  * Load the AISMM model definition from YAML
- * Uses in-memory cache to avoid repeated file reads (192KB file)
+ * Uses in-memory cache to avoid repeated file reads (192KB file), and
+ * reuses the model parsed by `npm run sync` when it came from identical YAML
  */
 export async function loadAISMMModel(): Promise<AISMMModel> {
   // Return cached model if already loaded
@@ -106,12 +108,12 @@ export async function loadAISMMModel(): Promise<AISMMModel> {
     join(currentDir, '..', '..', '..', '..', 'public', 'aismm.yaml'),  // Alternative public path
   ];
 
-  let yamlContent: string | null = null;
+  let yamlContent: Buffer | null = null;
   const errors: string[] = [];
 
   for (const yamlPath of possiblePaths) {
     try {
-      yamlContent = await readFile(yamlPath, 'utf-8');
+      yamlContent = await readFile(yamlPath);
       console.log(`[AISMM] Loaded model from: ${yamlPath}`);
       break;
     } catch (err) {
@@ -124,7 +126,9 @@ export async function loadAISMMModel(): Promise<AISMMModel> {
     throw new Error(`Could not find AISMM definition file. Tried paths:\n${errors.join('\n')}`);
   }
 
-  const parsed = parseYaml(yamlContent);
+  // Skip parsing if the shared model cache was built from these exact bytes
+  const cached = readModelCache(hashContent(yamlContent));
+  const parsed = (cached ? cached.model : parseYaml(yamlContent.toString('utf-8'))) as AISMMModel;
 
   // Transform to our model structure and cache it
   cachedAISMMModel = {